@@ -1,19 +1,23 @@
 import sys
+import time
 from dataclasses import dataclass
 from importlib.resources import files
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import pandas as pd
 import streamlit as st
 
-from pytest_ui.parser import TestResult, parse_pytest_report
+from pytest_ui.parser import parse_pytest_report_df
 from pytest_ui.runner import PytestRunner
 
 # ---------------------------------------------------------
 # UTILITIES
 # ---------------------------------------------------------
 
+# Minimum seconds between two live output updates while tests run
+LIVE_OUTPUT_INTERVAL = 0.1
+
 
 def _get_project_path_from_cli() -> Path:
     """Get project path passed after streamlit run."""
@@ -33,21 +37,87 @@ def _configure() -> Config:
     return Config(tests_path=Path(default_path), keyword=None)
 
 
-@st.cache_data(show_spinner=False)
+# Runs kept per session, enough to flip between a few keywords
+MAX_CACHED_RUNS = 4
+
+
+def _run_pytest(
+    tests_path: Path | str,
+    keyword: Optional[str] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+) -> dict:
+    """Run Pytest once per (path, keyword) and return the raw runner output.
+
+    Memoized in ``st.session_state`` rather than ``st.cache_resource``:
+    Streamlit replays the element calls a cached function made, and the
+    live output placeholder written by ``on_output`` does not exist on
+    later reruns. Callers must not mutate the returned output.
+    """
+    runs = st.session_state.setdefault("pytest_runs", {})
+    key = (str(tests_path), keyword)
+    if key not in runs:
+        runner = PytestRunner(Path(tests_path), debug=False)
+        runs[key] = runner.run_tests(keyword=keyword, on_output=on_output)
+        while len(runs) > MAX_CACHED_RUNS:
+            del runs[next(iter(runs))]
+    return runs[key]
+
+
+def _live_output(placeholder) -> Callable[[str], None]:
+    """Return an output callback showing pytest's latest line."""
+    last_update = 0.0
+
+    def on_output(line: str) -> None:
+        nonlocal last_update
+        now = time.monotonic()
+        # Throttled so a fast suite does not flood the browser with deltas
+        if line.strip() and now - last_update >= LIVE_OUTPUT_INTERVAL:
+            placeholder.text(line.rstrip())
+            last_update = now
+
+    return on_output
+
+
+STATUS_EMOJIS = {
+    "passed": "🟢",
+    "failed": "🟡",
+    "skipped": "⏭️",
+}
+
+
+# Only the latest few reports are ever displayed again
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _parse_report(created: float, _report: dict) -> pd.DataFrame:
+    """Build the ready-to-render results DataFrame once per JSON report."""
+    df = parse_pytest_report_df(_report)
+    if df.empty:
+        return df
+
+    # xdist reports tests in completion order; sort once so files and
+    # tests keep the same order from one run to the next.
+    df = df.sort_values("nodeid", kind="stable", ignore_index=True)
+    df["nodeid_short"] = df["nodeid"].astype("string").str.partition("::")[0]
+    df["status_emoji"] = df["outcome"].cat.rename_categories(STATUS_EMOJIS)
+    # Lowercased copies so the search box can match without a regex
+    df["name_lc"] = df["name"].str.lower()
+    df["nodeid_lc"] = df["nodeid"].str.lower()
+    return df
+
+
 def _run_tests(
-    tests_path: Path | str, keyword: Optional[str] = None
-) -> tuple[list["TestResult"] | None, str]:
+    tests_path: Path | str,
+    keyword: Optional[str] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+) -> tuple[pd.DataFrame | None, str]:
     """Run Pytest and return (results, output)."""
-    runner = PytestRunner(Path(tests_path), debug=False)
-
-    output = runner.run_tests(keyword=keyword)
+    output = _run_pytest(tests_path, keyword, on_output)
     report = output.get("report")
     out = output["stdout"] or output["stderr"] or "No output."
 
     if not report:
         return None, out
 
-    return parse_pytest_report(report), out
+    return _parse_report(report.get("created", 0.0), report), out
 
 
 # ---------------------------------------------------------
@@ -88,8 +158,9 @@ def sidebar_config(config: Config) -> tuple[bool, str | None, str, bool]:
 
 def metrics_panel(df: pd.DataFrame):
     """Pretty top metrics."""
-    passed = len(df[df["outcome"] == "passed"])
-    failed = len(df[df["outcome"] == "failed"])
+    counts = df["outcome"].value_counts()
+    passed = int(counts.get("passed", 0))
+    failed = int(counts.get("failed", 0))
     total = len(df)
 
     c1, c2, c3 = st.columns(3)
@@ -124,49 +195,54 @@ def metrics_panel(df: pd.DataFrame):
 
 
 def results_table(df: pd.DataFrame):
-    """Group tests by file and show expandable sections with filtering."""
+    """Summarize tests by file and show them in a single filterable table."""
     st.subheader("📂 Test Groups")
 
     # Search input
     search = st.text_input("🔍 Search test name / file")
     if search:
-        df = df[
-            df["name"].str.contains(search, case=False)
-            | df["nodeid"].str.contains(search, case=False)
-        ].copy()
-
-    # Replace status for UI
-    df["nodeid"] = df["nodeid"].astype(str).str.split("::").str[0]
-    df["status_emoji"] = df["outcome"].map(
-        {
-            "passed": "🟢",
-            "failed": "🟡",
-            "skipped": "⏭️",
-        }
+        search_lc = search.lower()
+        mask = (
+            df["name_lc"].str.contains(search_lc, regex=False)
+            | df["nodeid_lc"].str.contains(search_lc, regex=False)
+        )
+        df = df.loc[mask]
+
+    if df.empty:
+        st.info("No tests match the search.")
+        return
+
+    # Count outcomes for every file in one pass
+    counts = (
+        df.groupby(["nodeid_short", "outcome"], sort=False, observed=True)
+        .size()
+        .unstack(fill_value=0)
+    )
+    total = counts.sum(axis=1)
+    counts = counts.reindex(columns=["passed", "failed"], fill_value=0)
+
+    # One table per section instead of one per file keeps the number of
+    # serialized frames constant however many files the suite has.
+    st.dataframe(
+        pd.DataFrame(
+            {
+                "Status": counts["failed"].eq(0).map({True: "🟢", False: "🟡"}),
+                "File": counts.index,
+                "Passed": counts["passed"].astype(str) + "/" + total.astype(str),
+            }
+        ),
+        hide_index=True,
     )
 
-    grouped = df.groupby("nodeid")
-
-    for group_name, group in grouped:
-        total = len(group)
-        failed = len(group[group["outcome"] == "failed"])
-        passed = len(group[group["outcome"] == "passed"])
-
-        badge = "🟢" if failed == 0 else "🟡"
-
-        with st.expander(
-            f"{badge} {group_name}  ({passed}/{total})",
-            expanded=False,
-        ):
-            # Style dataframe
-            st.dataframe(
-                group[["name", "status_emoji", "duration", "message"]].rename(
-                    columns={
-                        "status_emoji": "Status",
-                        "duration": "Duration (s)",
-                    }
-                )
-            )
+    st.dataframe(
+        df[["nodeid_short", "name", "status_emoji", "duration", "message"]],
+        hide_index=True,
+        column_config={
+            "nodeid_short": "File",
+            "status_emoji": "Status",
+            "duration": "Duration (s)",
+        },
+    )
 
 
 def logs_panel(df: pd.DataFrame, full_output: str):
@@ -179,9 +255,14 @@ def logs_panel(df: pd.DataFrame, full_output: str):
         if df.empty:
             st.info("No test results to display logs for.")
         else:
-            selected = st.selectbox("Select a test:", df["name"])
-            test = df[df["name"] == selected].iloc[0]
-            st.code(test["message"] or "No log available.", language="bash")
+            names = df["name"]
+            selected = st.selectbox(
+                "Select a test:",
+                names.index,
+                format_func=names.__getitem__,
+            )
+            message = df.at[selected, "message"]
+            st.code(message or "No log available.", language="bash")
 
     with tab2:
         st.code(
@@ -224,18 +305,20 @@ if __name__ == "__main__":
     # Run tests
     with st.status("Running tests...", expanded=True) as status:
         if not use_cache:
-            st.cache_data.clear()
+            st.session_state.pop("pytest_runs", None)
+            _parse_report.clear()
 
-        results, output = _run_tests(project_path, keyword)
+        live = st.empty()
+        df, output = _run_tests(project_path, keyword, _live_output(live))
+        live.empty()
         status.success("Tests completed!")
 
-    if not results:
+    if df is None or df.empty:
         st.error("Unable to run tests.")
         st.code(output, language="bash")
         st.stop()
 
     # Main UI
-    df = pd.DataFrame([r.__dict__ for r in results])
 
     metrics_panel(df)
     results_table(df)
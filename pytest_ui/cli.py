@@ -1,5 +1,7 @@
 import os
+import shutil
 import subprocess
+import sys
 from importlib.resources import files
 from pathlib import Path
 
@@ -14,6 +16,9 @@ PYTEST_UI_WELCOME_TEXT = """
 ╚═╝        ╚═╝      ╚═╝   ╚══════╝╚══════╝   ╚═╝        ╚═════╝ ╚═╝
         """
 
+# Resolved once instead of letting exec search PATH
+STREAMLIT_BIN = shutil.which("streamlit") or "streamlit"
+
 
 @click.command()
 @click.option(
@@ -44,7 +49,7 @@ def main(port, path):
     os.environ["STREAMLIT_CONFIG_DIR"] = str(config_dir)
 
     cmd = [
-        "streamlit",
+        STREAMLIT_BIN,
         "run",
         str(app_path),
         "--server.port",
@@ -55,11 +60,34 @@ def main(port, path):
         str(whereis),
     ]
 
-    subprocess.run(
-        cmd,
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    _launch(cmd)
+
+
+def _launch(cmd: list[str]) -> None:
+    """Hand the terminal over to streamlit, silencing its own output."""
+    # Checked up front: once output is silenced below, a failed exec
+    # would exit without any message.
+    if shutil.which(cmd[0]) is None:
+        raise click.ClickException(
+            f"'{cmd[0]}' was not found. Install it with `pip install streamlit`."
+        )
+
+    if os.name != "posix":
+        subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        return
+
+    # Replace this process with streamlit instead of waiting on a child:
+    # Ctrl-C reaches streamlit directly and no idle Python process remains.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, sys.stdout.fileno())
+    os.dup2(devnull, sys.stderr.fileno())
+    os.execvp(cmd[0], cmd)
 
 
 if __name__ == "__main__":
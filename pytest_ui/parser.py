@@ -1,8 +1,22 @@
+import mmap
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List, Optional
 
+import orjson
+import pandas as pd
 
-@dataclass
+# Outcomes pytest-json-report emits for plain pytest; outcomes added by
+# plugins (e.g. pytest-rerunfailures' "rerun") are appended per report.
+OUTCOME_DTYPE = pd.CategoricalDtype(
+    ["passed", "failed", "skipped", "error", "xfailed", "xpassed"]
+)
+
+# Shared stand-in for a missing "call" section; never mutated
+_EMPTY: dict = {}
+
+
+@dataclass(slots=True, frozen=True)
 class TestResult:
     nodeid: str
     name: str
@@ -12,22 +26,89 @@ class TestResult:
     file: str
 
 
+def _call_message(test: dict) -> str:
+    """Return the call longrepr, minus the worker line xdist prepends."""
+    message = (test.get("call") or _EMPTY).get("longrepr") or ""
+    if message.startswith("[gw"):
+        message = message.partition("\n")[2].lstrip("\n")
+    return message
+
+
 def parse_pytest_report(report: dict) -> List[TestResult]:
     """Transforme le rapport JSON pytest en objets Python."""
     if not report or "tests" not in report:
         return []
 
-    results = []
-    for test in report["tests"]:
-        name = test.get("keywords", [test["nodeid"].split("::")[-1]])[0]
-        results.append(
-            TestResult(
-                nodeid=test["nodeid"],
-                name=name,
-                outcome=test["outcome"],
-                duration=test.get("duration", 0.0),
-                message=test.get("call", {}).get("longrepr", ""),
-                file=test.get("file", test["nodeid"].split("::")[0]),
-            )
+    return [
+        TestResult(
+            nodeid=(nodeid := test["nodeid"]),
+            name=(test.get("keywords") or [nodeid.rpartition("::")[2]])[0],
+            outcome=test["outcome"],
+            duration=test.get("duration", 0.0),
+            message=_call_message(test),
+            file=test.get("file") or nodeid.partition("::")[0],
         )
-    return results
+        for test in report["tests"]
+    ]
+
+
+def parse_pytest_report_df(report: dict) -> pd.DataFrame:
+    """Transform the JSON pytest report straight into a columnar DataFrame.
+
+    Columns match the ``TestResult`` fields, but no per-test object is built.
+    Text columns use the ``string`` dtype, ``outcome`` and ``file`` are
+    categoricals and ``duration`` is float32, even for an empty report.
+    ``outcome`` keeps outcomes outside ``OUTCOME_DTYPE`` as extra categories.
+    """
+    tests = report.get("tests", []) if report else []
+    size = len(tests)
+    nodeids: list = [None] * size
+    names: list = [None] * size
+    outcomes: list = [None] * size
+    durations: list = [0.0] * size
+    messages: list = [None] * size
+    test_files: list = [None] * size
+
+    for i, test in enumerate(tests):
+        nodeid = nodeids[i] = test["nodeid"]
+        names[i] = (test.get("keywords") or [nodeid.rpartition("::")[2]])[0]
+        outcomes[i] = test["outcome"]
+        durations[i] = test.get("duration", 0.0)
+        messages[i] = _call_message(test)
+        test_files[i] = test.get("file") or nodeid.partition("::")[0]
+
+    outcome_dtype = OUTCOME_DTYPE
+    extra = set(outcomes).difference(OUTCOME_DTYPE.categories)
+    if extra:
+        outcome_dtype = pd.CategoricalDtype(
+            [*OUTCOME_DTYPE.categories, *sorted(extra)]
+        )
+
+    return pd.DataFrame(
+        {
+            "nodeid": pd.array(nodeids, dtype="string"),
+            "name": pd.array(names, dtype="string"),
+            "outcome": pd.Categorical(outcomes, dtype=outcome_dtype),
+            "duration": pd.array(durations, dtype="float32"),
+            "message": pd.array(messages, dtype="string"),
+            "file": pd.Categorical(test_files),
+        }
+    )
+
+
+def load_pytest_report(path: Path | str) -> dict:
+    """Decode a JSON report file straight from the OS page cache.
+
+    The file is memory-mapped so orjson reads it in place instead of from
+    a bytes copy; empty files and platforms that refuse the mapping fall
+    back to a plain read.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return orjson.loads(f.read())
+
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
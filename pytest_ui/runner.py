@@ -1,21 +1,175 @@
-import json
+import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from collections import deque
+from fnmatch import fnmatch
+from functools import cached_property
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, TextIO
+
+import orjson
+
+from pytest_ui.parser import load_pytest_report
+
+# Resolved once per process instead of searching PATH on every run
+PYTEST_BIN = shutil.which("pytest") or "pytest"
+
+# Keep only the tail of very verbose runs in memory
+MAX_OUTPUT_LINES = 10_000
+
+# Below this many test files, xdist worker startup outweighs the gain
+XDIST_MIN_FILES = 4
+
+# pytest's default norecursedirs
+NORECURSE_DIRS = (
+    "*.egg",
+    ".*",
+    "_darcs",
+    "build",
+    "CVS",
+    "dist",
+    "node_modules",
+    "venv",
+    "{arch}",
+)
+
+# pytest-json-report sections the parser never reads
+REPORT_OMIT = ("collectors", "log", "traceback", "streams", "warnings")
+
+
+def _has_xdist() -> bool:
+    """Return True when the pytest-xdist plugin is importable."""
+    return find_spec("xdist") is not None
+
+
+def _count_test_files(path: Path, limit: int) -> int:
+    """Count test files the way pytest collects them, stopping at ``limit``.
+
+    Directories matching pytest's default ``norecursedirs`` and virtualenvs
+    are pruned, so ``.venv``, ``.git`` or ``node_modules`` are never walked.
+    """
+    if path.is_file():
+        return 1
+
+    count = 0
+    for root, dirs, filenames in os.walk(path):
+        dirs[:] = [
+            d
+            for d in dirs
+            if not any(fnmatch(d, pattern) for pattern in NORECURSE_DIRS)
+            and not os.path.exists(os.path.join(root, d, "pyvenv.cfg"))
+        ]
+        count += sum(
+            1
+            for name in filenames
+            if name.endswith(".py")
+            and (name.startswith("test_") or name.endswith("_test.py"))
+        )
+        if count >= limit:
+            return limit
+    return count
+
+
+class _Tail:
+    """Keep the last ``maxlen`` lines of a stream and count the rest."""
+
+    def __init__(self, maxlen: int):
+        self.lines: deque[str] = deque(maxlen=maxlen)
+        self.total = 0
+
+    def append(self, line: str) -> None:
+        self.lines.append(line)
+        self.total += 1
+
+    def text(self) -> str:
+        dropped = self.total - len(self.lines)
+        marker = f"[… {dropped} earlier lines dropped]\n" if dropped else ""
+        return marker + "".join(self.lines)
+
+
+def _drain(pipe: TextIO, tail: _Tail) -> None:
+    """Read a pipe line by line into a bounded buffer until it closes."""
+    with pipe:
+        for line in pipe:
+            tail.append(line)
 
 
 class PytestRunner:
 
-    def __init__(self, project_path: Path, debug: bool = False):
-        self.project_path = Path(project_path).resolve()
-        self.tmp_dir = Path(tempfile.gettempdir()) / "pytest_ui"
-        self.tmp_dir.mkdir(exist_ok=True)
-        self.report_file = self.tmp_dir / "report.json"
+    def __init__(
+        self,
+        project_path: Path,
+        debug: bool = False,
+        max_output_lines: int = MAX_OUTPUT_LINES,
+        assert_mode: str = "rewrite",
+        use_cache: bool = True,
+    ):
+        if assert_mode not in ("rewrite", "plain"):
+            raise ValueError(
+                f"assert_mode must be 'rewrite' or 'plain', not {assert_mode!r}."
+            )
+
+        self._project_path = project_path
         self.debug = debug
+        self.max_output_lines = max_output_lines
+        self.assert_mode = assert_mode
+        self.use_cache = use_cache
+
+    # Paths are resolved and created on first use, so building a runner
+    # on every Streamlit rerun costs no syscalls.
+    @cached_property
+    def project_path(self) -> Path:
+        return Path(self._project_path).resolve()
+
+    @cached_property
+    def tmp_dir(self) -> Path:
+        tmp_dir = os.path.join(tempfile.gettempdir(), "pytest_ui")
+        os.makedirs(tmp_dir, exist_ok=True)
+        return Path(tmp_dir)
+
+    @cached_property
+    def report_file(self) -> Path:
+        return self.tmp_dir / "report.json"
+
+    def _xdist_args(self) -> list[str]:
+        """Return pytest-xdist options, or none when they would not pay off.
+
+        Tests are spread file by file (``--dist=loadfile``) so module and
+        class fixtures are still shared, which means there is no point in
+        more workers than test files, nor in paying worker startup for
+        small suites.
+        """
+        if not _has_xdist():
+            return []
+
+        cpus = os.cpu_count() or 1
+        n_files = _count_test_files(
+            self.project_path, limit=max(cpus, XDIST_MIN_FILES)
+        )
+        if n_files < XDIST_MIN_FILES:
+            return []
 
-    def run_tests(self, keyword: Optional[str] = None) -> dict:
-        """Exécute pytest et génère un rapport JSON."""
+        workers = min(cpus, n_files)
+        if workers < 2:
+            return []
+
+        return ["-n", str(workers), "--dist=loadfile"]
+
+    def run_tests(
+        self,
+        keyword: Optional[str] = None,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> dict:
+        """Exécute pytest et génère un rapport JSON.
+
+        Output is read while pytest runs; ``on_output`` is called with each
+        stdout line as soon as it is printed. Only the last
+        ``max_output_lines`` lines of each stream are kept, behind a marker
+        saying how many earlier lines were dropped.
+        """
         if not self.project_path.exists():
             raise FileNotFoundError(
                 f"""
@@ -23,39 +177,72 @@ Le dossier {self.project_path} n'existe pas. Veuillez vérifier le chemin."""
             )
 
         cmd = [
-            "pytest",
+            PYTEST_BIN,
             str(self.project_path),
-            "-vv",
+            "-v",
             "--json-report",
             f"--json-report-file={self.report_file}",
-            "-q",
+            # The UI only reads nodeid, keywords, outcome, duration and
+            # longrepr; leave everything else out of the report.
+            "--json-report-omit",
+            *REPORT_OMIT,
         ]
         if keyword:
             cmd += ["-k", keyword]
 
+        # Plain asserts avoid the rewrite hook (which trips over
+        # Numba-compiled test modules) and skipping the cache provider
+        # saves its .pytest_cache writes on every run.
+        if self.assert_mode == "plain":
+            cmd += ["--assert=plain"]
+
+        if not self.use_cache:
+            cmd += ["-p", "no:cacheprovider"]
+
         if self.debug:
             cmd += ["-v", "-s", "--maxfail=1", "--disable-warnings"]
+        else:
+            cmd += self._xdist_args()
 
-        process = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
+            bufsize=1,
             cwd=self.project_path.parent.parent,
             env=None,
         )
 
+        stdout = _Tail(self.max_output_lines)
+        stderr = _Tail(self.max_output_lines)
+
+        # Drain stderr in the background so neither pipe can fill up and
+        # block pytest while stdout is being read here.
+        stderr_reader = threading.Thread(
+            target=_drain, args=(process.stderr, stderr), daemon=True
+        )
+        stderr_reader.start()
+
+        with process.stdout:
+            for line in process.stdout:
+                stdout.append(line)
+                if on_output:
+                    on_output(line)
+
+        stderr_reader.join()
+
         result = {
-            "stdout": process.stdout,
-            "stderr": process.stderr,
-            "exit_code": process.returncode,
+            "stdout": stdout.text(),
+            "stderr": stderr.text(),
+            "exit_code": process.wait(),
             "report": None,
         }
 
         if self.report_file.exists():
             try:
-                with open(self.report_file, "r", encoding="utf-8") as f:
-                    result["report"] = json.load(f)
-            except json.JSONDecodeError:
+                result["report"] = load_pytest_report(self.report_file)
+            except orjson.JSONDecodeError:
                 result[
                     "stderr"
                 ] += """
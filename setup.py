@@ -15,8 +15,10 @@ Interface utilisateur pour visualiser les résultats de pytest
         "streamlit",
         "pytest",
         "pytest-json-report",
+        "pytest-xdist",
         "click",
         "pandas",
+        "orjson",
     ],
     entry_points={
         "console_scripts": [
@@ -0,0 +1,66 @@
+import sys
+from importlib.resources import files
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+APP = str(files("pytest_ui").joinpath("app.py"))
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    tests = tmp_path / "proj" / "tests"
+    tests.mkdir(parents=True)
+    (tests / "test_a.py").write_text(
+        "def test_one():\n    assert True\n\n\ndef test_two():\n    assert 1 == 2\n"
+    )
+    (tests / "test_b.py").write_text("def test_three():\n    assert True\n")
+    monkeypatch.setattr(sys, "argv", ["app.py", str(tests)])
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.run()
+    at.button[0].click().run()
+    assert not at.exception
+    return at
+
+
+def _search(at: AppTest):
+    return next(t for t in at.text_input if t.label.startswith("🔍"))
+
+
+def test_run_renders_results(app):
+    assert len(app.dataframe) == 2
+    assert len(app.selectbox[0].options) == 3
+
+
+@pytest.mark.parametrize(
+    "rerun",
+    [
+        lambda at: at.run(),
+        lambda at: _search(at).input("test_a").run(),
+        lambda at: at.selectbox[0].select_index(1).run(),
+    ],
+    ids=["rerun", "search", "select"],
+)
+def test_rerun_keeps_results(app, rerun):
+    rerun(app)
+
+    assert not app.exception
+    assert len(app.dataframe) == 2
+
+
+def test_rerun_reuses_the_run(app):
+    runs = app.session_state["pytest_runs"]
+    output = next(iter(runs.values()))
+
+    app.run()
+
+    assert app.session_state["pytest_runs"] is runs
+    assert list(runs.values()) == [output]
+
+
+def test_rerun_without_cache(app):
+    app.toggle[0].set_value(False).run()
+
+    assert not app.exception
+    assert len(app.dataframe) == 2
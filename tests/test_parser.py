@@ -0,0 +1,114 @@
+import orjson
+import pandas as pd
+import pytest
+
+from pytest_ui.parser import (
+    OUTCOME_DTYPE,
+    _call_message,
+    load_pytest_report,
+    parse_pytest_report_df,
+)
+
+
+def _test(nodeid: str, outcome: str = "passed", **extra) -> dict:
+    return {"nodeid": nodeid, "outcome": outcome, "duration": 0.5, **extra}
+
+
+@pytest.mark.parametrize(
+    "test, expected",
+    [
+        ({}, ""),
+        ({"call": None}, ""),
+        ({"call": {"longrepr": None}}, ""),
+        ({"call": {"longrepr": "assert 1 == 2"}}, "assert 1 == 2"),
+        (
+            {"call": {"longrepr": "[gw0] linux -- Python 3.12\nassert 1 == 2"}},
+            "assert 1 == 2",
+        ),
+        (
+            {"call": {"longrepr": "[gw3] linux -- Python 3.12\n\nE  boom\nE  bang"}},
+            "E  boom\nE  bang",
+        ),
+    ],
+)
+def test_call_message(test, expected):
+    assert _call_message(test) == expected
+
+
+@pytest.mark.parametrize(
+    "report",
+    [
+        None,
+        {},
+        {"tests": []},
+        {"tests": [_test("test_a.py::test_one"), _test("test_b.py::test_two")]},
+    ],
+)
+def test_parse_pytest_report_df_dtypes(report):
+    df = parse_pytest_report_df(report)
+
+    assert list(df.columns) == [
+        "nodeid",
+        "name",
+        "outcome",
+        "duration",
+        "message",
+        "file",
+    ]
+    assert df["nodeid"].dtype == "string"
+    assert df["name"].dtype == "string"
+    assert df["message"].dtype == "string"
+    assert df["outcome"].dtype == OUTCOME_DTYPE
+    assert isinstance(df["file"].dtype, pd.CategoricalDtype)
+    assert df["duration"].dtype == "float32"
+
+
+def test_parse_pytest_report_df_values():
+    report = {
+        "tests": [
+            _test(
+                "tests/test_a.py::test_one",
+                "failed",
+                keywords=["test_one", "test_a.py"],
+                call={"longrepr": "[gw1] linux -- Python 3.12\nassert False"},
+            ),
+            _test("tests/test_a.py::test_two"),
+        ]
+    }
+
+    df = parse_pytest_report_df(report)
+
+    assert df["name"].tolist() == ["test_one", "test_two"]
+    assert df["outcome"].tolist() == ["failed", "passed"]
+    assert df["message"].tolist() == ["assert False", ""]
+    assert df["file"].tolist() == ["tests/test_a.py", "tests/test_a.py"]
+
+
+def test_parse_pytest_report_df_keeps_plugin_outcomes():
+    report = {"tests": [_test("test_a.py::test_one", "rerun"), _test("test_a.py::t")]}
+
+    df = parse_pytest_report_df(report)
+
+    assert df["outcome"].tolist() == ["rerun", "passed"]
+    assert not df["outcome"].isna().any()
+    assert list(df["outcome"].cat.categories) == [
+        *OUTCOME_DTYPE.categories,
+        "rerun",
+    ]
+
+
+def test_load_pytest_report(tmp_path):
+    report = {"created": 1.5, "tests": [_test("test_a.py::test_one")]}
+    path = tmp_path / "report.json"
+    path.write_bytes(orjson.dumps(report))
+
+    assert load_pytest_report(path) == report
+    assert load_pytest_report(str(path)) == report
+
+
+def test_load_pytest_report_empty_file(tmp_path):
+    path = tmp_path / "report.json"
+    path.write_bytes(b"")
+
+    with pytest.raises(orjson.JSONDecodeError):
+        load_pytest_report(path)
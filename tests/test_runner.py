@@ -0,0 +1,120 @@
+from pathlib import Path
+
+import pytest
+
+from pytest_ui import runner
+from pytest_ui.runner import (
+    XDIST_MIN_FILES,
+    PytestRunner,
+    _count_test_files,
+    _Tail,
+)
+
+
+def _touch(root: Path, *names: str) -> None:
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+
+def test_count_test_files_patterns(tmp_path):
+    _touch(tmp_path, "test_a.py", "b_test.py", "pkg/test_c.py", "conftest.py", "util.py")
+
+    assert _count_test_files(tmp_path, limit=100) == 3
+
+
+def test_count_test_files_single_file(tmp_path):
+    _touch(tmp_path, "test_a.py")
+
+    assert _count_test_files(tmp_path / "test_a.py", limit=100) == 1
+
+
+@pytest.mark.parametrize(
+    "ignored",
+    [
+        ".venv/lib/test_x.py",
+        ".git/test_x.py",
+        "node_modules/pkg/test_x.py",
+        "build/test_x.py",
+        "dist/test_x.py",
+        "venv/test_x.py",
+        "foo.egg/test_x.py",
+        "env/test_x.py",
+    ],
+)
+def test_count_test_files_prunes_ignored_dirs(tmp_path, ignored):
+    _touch(tmp_path, "test_a.py", ignored)
+    # A virtualenv is recognised by its marker, whatever its name
+    _touch(tmp_path, "env/pyvenv.cfg")
+
+    assert _count_test_files(tmp_path, limit=100) == 1
+
+
+def test_count_test_files_stops_at_limit(tmp_path):
+    _touch(tmp_path, *(f"test_{i}.py" for i in range(10)))
+
+    assert _count_test_files(tmp_path, limit=3) == 3
+
+
+@pytest.mark.parametrize(
+    "has_xdist, cpus, n_files, expected",
+    [
+        (False, 8, 10, []),
+        (True, 8, XDIST_MIN_FILES - 1, []),
+        (True, 1, 10, []),
+        (True, None, 10, []),
+        (True, 8, XDIST_MIN_FILES, ["-n", str(XDIST_MIN_FILES), "--dist=loadfile"]),
+        (True, 2, 10, ["-n", "2", "--dist=loadfile"]),
+        (True, 8, 10, ["-n", "8", "--dist=loadfile"]),
+    ],
+)
+def test_xdist_args(tmp_path, monkeypatch, has_xdist, cpus, n_files, expected):
+    _touch(tmp_path, *(f"test_{i}.py" for i in range(n_files)))
+    monkeypatch.setattr(runner, "_has_xdist", lambda: has_xdist)
+    monkeypatch.setattr(runner.os, "cpu_count", lambda: cpus)
+
+    assert PytestRunner(tmp_path)._xdist_args() == expected
+
+
+def test_invalid_assert_mode(tmp_path):
+    with pytest.raises(ValueError):
+        PytestRunner(tmp_path, assert_mode="nope")
+
+
+@pytest.mark.parametrize(
+    "maxlen, lines, expected",
+    [
+        (3, [], ""),
+        (3, ["a\n", "b\n"], "a\nb\n"),
+        (3, ["a\n", "b\n", "c\n"], "a\nb\nc\n"),
+        (2, ["a\n", "b\n", "c\n"], "[… 1 earlier lines dropped]\nb\nc\n"),
+        (1, ["a\n", "b\n", "c\n"], "[… 2 earlier lines dropped]\nc\n"),
+    ],
+)
+def test_tail(maxlen, lines, expected):
+    tail = _Tail(maxlen)
+    for line in lines:
+        tail.append(line)
+
+    assert tail.text() == expected
+
+
+def test_run_tests_streams_output(tmp_path):
+    tests = tmp_path / "proj" / "tests"
+    tests.mkdir(parents=True)
+    (tests / "test_a.py").write_text(
+        "def test_one():\n    assert True\n\n\ndef test_two():\n    assert False\n"
+    )
+    lines = []
+
+    result = PytestRunner(tests, max_output_lines=2).run_tests(
+        on_output=lines.append
+    )
+
+    assert result["exit_code"] == 1
+    assert any("test_one PASSED" in line for line in lines)
+    assert any("test_two FAILED" in line for line in lines)
+    assert result["stdout"].startswith(f"[… {len(lines) - 2} earlier lines dropped]\n")
+    assert result["stdout"].endswith("".join(lines[-2:]))
+    assert [t["outcome"] for t in result["report"]["tests"]] == ["passed", "failed"]